@@ -1,70 +1,145 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Optional
 import bcrypt
+import orjson
 from fastapi.security import OAuth2PasswordBearer
-from pydantic import BaseModel, EmailStr, field_validator
-from jose import jwt, JWTError
-from jose.exceptions import ExpiredSignatureError
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter, field_validator
+import jwt
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+import anyio.to_thread
+import base64
+import hashlib
 import os
+import time
+from dataclasses import dataclass
+from itertools import count
 from uuid import uuid4
 
-load_dotenv()
+# В проде (docker/systemd) переменные уже в окружении — .env читаем и
+# парсим только если их нет, чтобы не тратить время на каждый старт воркера
+if os.environ.get("SECRET_KEY") is None:
+    load_dotenv()
+
+# Конфигурация приложения: читается из окружения один раз при старте;
+# frozen + slots — неизменяемый объект с быстрым доступом к полям
+@dataclass(frozen=True, slots=True)
+class Settings:
+    secret_key: str
+    algorithm: str
+    # Время жизни токенов в секундах
+    access_ttl_seconds: int
+    refresh_ttl_seconds: int
+    # Стоимость bcrypt: каждый шаг вниз вдвое уменьшает CPU на хеширование
+    bcrypt_rounds: int
+    # Включает отладочные эндпоинты (/debug-token)
+    debug_mode: bool
+
+
+settings = Settings(
+    secret_key=os.getenv("SECRET_KEY"),
+    algorithm=os.getenv("ALGORITHM"),
+    access_ttl_seconds=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")) * 60,
+    refresh_ttl_seconds=int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS")) * 86400,
+    bcrypt_rounds=int(os.getenv("BCRYPT_ROUNDS", "10")),
+    debug_mode=os.getenv("DEBUG_MODE", "False").lower() == "true",
+)
 
-# Конфигурация для JWT
-secret_key = os.getenv("SECRET_KEY")
-algorithm = os.getenv("ALGORITHM")
-access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
-refresh_token_expire_days = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS"))
+# timezone.utc — синглтон; держим ссылку локально в модуле
+_UTC = timezone.utc
 active_refresh_tokens = {}
+# Обратный индекс email -> id активных refresh-токенов: отзыв при логине
+# не требует обхода всех токенов
+email_to_token_ids: Dict[str, set] = {}
+
+def _prehash_password(password: str) -> bytes:
+    # bcrypt молча обрезает вход на 72 байтах; SHA-256 + base64 даёт
+    # константные 44 байта, так что длинные пароли учитываются целиком
+    return base64.b64encode(hashlib.sha256(password.encode('utf-8')).digest())
+
+
+def _hash_password(password: str) -> bytes:
+    # bcrypt — чистый CPU (~сотни мс); вызывается только через
+    # anyio.to_thread.run_sync, чтобы не блокировать event loop
+    return bcrypt.hashpw(_prehash_password(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds))
 
 def generate_id():
     return str(uuid4())
 
 def create_access_token(data: dict):
-    # Добавляем дату истечения токена
+    # Добавляем дату истечения токена: "exp" как UNIX-время, без
+    # промежуточных datetime/timedelta-объектов
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=access_token_expire_minutes)
-    to_encode.update({"exp": expire})  # Поле "exp" указывает, когда токен истечет
+    to_encode["exp"] = int(time.time()) + settings.access_ttl_seconds
 
     # Генерируем токен
-    return jwt.encode(to_encode, secret_key, algorithm=algorithm)
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Кеш проверенных access-токенов: blake2b(token) -> (exp, payload).
+# Повторные запросы с тем же токеном не пересчитывают HMAC и разбор JSON
+_jwt_cache: Dict[bytes, tuple] = {}
+_JWT_CACHE_MAX = 1024
+
+
 def verify_access_token(token: str):
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _jwt_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
     try:
-        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
-        return payload  # Возвращаем данные токена, если он валиден
-    except JWTError:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    exp = payload.get("exp")
+    if exp:
+        if len(_jwt_cache) >= _JWT_CACHE_MAX:
+            # Подчищаем просроченные записи, чтобы кеш не рос бесконечно
+            for stale in [k for k, v in _jwt_cache.items() if v[0] <= now]:
+                del _jwt_cache[stale]
+        if len(_jwt_cache) < _JWT_CACHE_MAX:
+            _jwt_cache[key] = (exp, payload)
+    return payload  # Возвращаем данные токена, если он валиден
 
 
 # def create_refresh_token(data: dict):
 #     to_encode = data.copy()
 #     expire = datetime.now(timezone.utc) + timedelta(days=refresh_token_expire_days)
 #     to_encode.update({"exp": expire})
-#     return jwt.encode(to_encode, secret_key, algorithm=algorithm)
+#     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 def create_refresh_token(data: dict):
     token_id = str(uuid4())  # Генерируем уникальный идентификатор
     email = data["sub"]
-    expire = datetime.now(timezone.utc) + timedelta(days=refresh_token_expire_days)
+    expire = int(time.time()) + settings.refresh_ttl_seconds
     to_encode = {"sub": email, "id": token_id, "exp": expire}
-    refresh_token = jwt.encode(to_encode, secret_key, algorithm=algorithm)
+    refresh_token = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
     # Сохраняем токен как активный
     active_refresh_tokens[token_id] = {"email": email, "expires_at": expire}
+    email_to_token_ids.setdefault(email, set()).add(token_id)
     return refresh_token
 
 app = FastAPI(
     title="To-Do API (FastAPI, in-memory)",
     description="Простой CRUD по задачам",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-tasks: list[dict] = []
+# id -> задача; dict даёт O(1) доступ и сохраняет порядок вставки
+tasks: dict[str, dict] = {}
+
+# Пустой 204-ответ без состояния — переиспользуем в delete-эндпоинтах,
+# чтобы не гонять пустое тело через JSON-сериализацию
+_empty_204 = Response(status_code=204)
+
+# Кеш сериализованных списков задач по владельцу; сбрасывается при любой
+# записи задач этого владельца, поэтому отдаёт только актуальные данные
+_tasks_list_cache: Dict[str, bytes] = {}
 
 
 class TaskBase(BaseModel):
@@ -72,7 +147,13 @@ class TaskBase(BaseModel):
     description: Optional[str] = None
     completed: bool = False
 class TaskCreate(TaskBase):
-    pass
+    # strip делается один раз при разборе запроса, а не в хендлере
+    @field_validator("title")
+    def validate_title(cls, v):
+        v = v.strip()
+        if not v:
+            raise ValueError("Field 'title' is required")
+        return v
 class Task(TaskBase):
     id: str
     owner: str
@@ -81,44 +162,42 @@ class TaskUpdate(BaseModel):
     description: Optional[str] = None
     completed: Optional[bool] = None
 
-@app.get("/tasks/", summary="Получить список задач", description="Возвращает все задачи юзера", response_model=List[Task])
-def list_tasks(user: dict = Depends(verify_access_token)):
-    return [t for t in tasks if t["owner"] == user["sub"]]
+@app.get("/tasks/", summary="Получить список задач", description="Возвращает все задачи юзера", response_model=None)
+async def list_tasks(user: dict = Depends(verify_access_token)) -> Response:
+    # Задачи хранятся уже в форме ответа — сериализуем их orjson'ом без
+    # повторной валидации через response_model
+    owner = user["sub"]
+    cached = _tasks_list_cache.get(owner)
+    if cached is None:
+        cached = orjson.dumps([t for t in tasks.values() if t["owner"] == owner])
+        _tasks_list_cache[owner] = cached
+    return Response(content=cached, media_type="application/json")
 
 @app.get("/tasks/{task_id}", summary="Получить задачу по id", description="Возвращает одну задачу по её идентификатору.", response_model=Task)
-def get_task(task_id: str, user: dict = Depends(verify_access_token)):
-    task = next(
-        (t for t in tasks if t["id"] == task_id and t["owner"] == user["sub"]),
-        None
-    )
-    if not task:
+async def get_task(task_id: str, user: dict = Depends(verify_access_token)):
+    task = tasks.get(task_id)
+    if task is None or task["owner"] != user["sub"]:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 @app.post("/tasks/", summary="Создать новую задачу", description="Создаёт задачу.", status_code=201)
-def create_task(data: TaskCreate, user: dict = Depends(verify_access_token)):
-    title = data.title.strip()
-    if not title:
-        raise HTTPException(status_code=400, detail="Field 'title' is required")
-
+async def create_task(data: TaskCreate, user: dict = Depends(verify_access_token)):
     task = {
         "id": generate_id(),
-        "title": title,
+        "title": data.title,
         "completed": data.completed,
         "description": data.description,
         "owner": user["sub"],
     }
 
-    tasks.append(task)
+    tasks[task["id"]] = task
+    _tasks_list_cache.pop(task["owner"], None)
     return task
 
 @app.put("/tasks/{task_id}", summary="Обновить задачу", description="Полностью обновляет поля задачи.", response_model=Task)
-def update_task(task_id: str, data: TaskUpdate, user: dict = Depends(verify_access_token)):
-    task = next(
-        (t for t in tasks if t["id"] == task_id and t["owner"] == user["sub"]),
-        None
-    )
-    if not task:
+async def update_task(task_id: str, data: TaskUpdate, user: dict = Depends(verify_access_token)):
+    task = tasks.get(task_id)
+    if task is None or task["owner"] != user["sub"]:
         raise HTTPException(status_code=404, detail="Task not found")
 
     if data.title is not None:
@@ -128,29 +207,36 @@ def update_task(task_id: str, data: TaskUpdate, user: dict = Depends(verify_acce
     if data.completed is not None:
         task["completed"] = data.completed
 
+    _tasks_list_cache.pop(task["owner"], None)
     return task
 
 
 @app.delete("/tasks/{task_id}", summary="Удалить задачу", description="Удаляет задачу по идентификатору.", status_code=204)
-def delete_task(task_id: str, user: dict = Depends(verify_access_token)):
-    global tasks
-    before = len(tasks)
-    tasks = [
-        t for t in tasks 
-        if not (t["id"] == task_id and t["owner"] == user["sub"])
-    ]
-    if len(tasks) == before:
+async def delete_task(task_id: str, user: dict = Depends(verify_access_token)):
+    task = tasks.get(task_id)
+    if task is None or task["owner"] != user["sub"]:
         raise HTTPException(status_code=404, detail="Task not found")
+    del tasks[task_id]
+    _tasks_list_cache.pop(task["owner"], None)
+    return _empty_204
+
+# Ответ /health неизменен — собираем его один раз при старте
+_health_response = ORJSONResponse({"status": "ok"})
+
 
 @app.get("/health", summary="Проверка работоспособности", description="Возвращает статус сервиса.")
-def health_check():
-    return {"status": "ok"}
+async def health_check():
+    return _health_response
 
 
 
 # ---- МОДЕЛИ ДЛЯ ПОЛЬЗОВАТЕЛЕЙ ----
 
 class UserBase(BaseModel):
+    # Пользователи в хранилище неизменяемые (update создаёт новый объект),
+    # frozen даёт более компактные экземпляры и быстрый доступ к полям
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     email: EmailStr
     role: str
@@ -168,6 +254,12 @@ class UserUpdate(BaseModel):
 class User(UserBase):
     id: int
 
+# Сериализатор списка пользователей, собранный один раз при импорте
+_user_list_adapter = TypeAdapter(List[User])
+
+# Сериализованный ответ GET /users/; сбрасывается при любой записи пользователей
+_users_list_cache: Optional[bytes] = None
+
 class RegisterRequest(BaseModel):
     name: str
     email: EmailStr
@@ -190,33 +282,37 @@ class RegisterRequest(BaseModel):
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    # Без EmailStr: на логине email — просто ключ поиска, его валидация
+    # уже сделана при регистрации, а несуществующий адрес отсечёт lookup
+    email: str
     password: str
 
+    # Приводим к нижнему регистру прямо при разборе запроса — дальше
+    # email используется как канонический ключ без повторных .lower()
+    @field_validator("email", mode="before")
+    def normalize_email(cls, v):
+        return v.lower() if isinstance(v, str) else v
+
 class RefreshRequest(BaseModel):
     refresh_token: str
     
-# Простое in-memory хранилище
-users: List[User] = []
-_next_user_id_user = 1
+# Простое in-memory хранилище: id -> User (dict сохраняет порядок вставки)
+users_by_id: Dict[int, User] = {}
+
+# Индекс по email (ключи в нижнем регистре) для O(1) проверки уникальности и поиска
+users_by_email: Dict[str, User] = {}
 
-# Хранилище паролей: email -> password
-user_passwords: Dict[str, str] = {}
+# Генератор id: связанный __next__ от count — один C-вызов без обёртки
+_next_user_id = count(1).__next__
 
+# Хранилище паролей: email (нижний регистр) -> bcrypt-хеш (bytes)
+user_passwords: Dict[str, bytes] = {}
 
-def _get_next_user_id() -> int:
-    global _next_user_id_user
-    val = _next_user_id_user
-    _next_user_id_user += 1
-    return val
 
+def _invalidate_users_cache() -> None:
+    global _users_list_cache
+    _users_list_cache = None
 
-def _find_user_index(user_id: int) -> int:
-    """Возвращает индекс пользователя в списке или -1, если не найден."""
-    for i, u in enumerate(users):
-        if u.id == user_id:
-            return i
-    return -1
 
 # ---- CRUD ДЛЯ ПОЛЬЗОВАТЕЛЕЙ ----
 
@@ -227,30 +323,36 @@ def _find_user_index(user_id: int) -> int:
     summary="Создать пользователя",
     description="Создаёт нового пользователя с уникальным email."
 )
-def create_user(user: UserCreate) -> User:
+async def create_user(user: UserCreate) -> User:
     # Проверка уникальности email
-    for u in users:
-        if u.email == user.email:
-            raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
+    if user.email.lower() in users_by_email:
+        raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
 
     new_user = User(
-        id=_get_next_user_id(),
+        id=_next_user_id(),
         name=user.name,
         email=user.email,
         role=user.role,
     )
-    users.append(new_user)
+    users_by_id[new_user.id] = new_user
+    users_by_email[new_user.email.lower()] = new_user
+    _invalidate_users_cache()
     return new_user
 
 
 @app.get(
     "/users/",
-    response_model=List[User],
+    response_model=None,
     summary="Получить список пользователей",
     description="Возвращает всех пользователей из памяти."
 )
-def list_users() -> List[User]:
-    return users
+async def list_users() -> Response:
+    # Объекты уже провалидированы при создании — сериализуем их напрямую
+    # Rust-ядром pydantic без повторной валидации через response_model
+    global _users_list_cache
+    if _users_list_cache is None:
+        _users_list_cache = _user_list_adapter.dump_json(list(users_by_id.values()))
+    return Response(content=_users_list_cache, media_type="application/json")
 
 
 @app.get(
@@ -259,11 +361,11 @@ def list_users() -> List[User]:
     summary="Получить пользователя по id",
     description="Возвращает пользователя по его идентификатору."
 )
-def get_user(user_id: int) -> User:
-    idx = _find_user_index(user_id)
-    if idx == -1:
+async def get_user(user_id: int) -> User:
+    user = users_by_id.get(user_id)
+    if user is None:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
-    return users[idx]
+    return user
 
 
 @app.put(
@@ -272,18 +374,16 @@ def get_user(user_id: int) -> User:
     summary="Обновить пользователя",
     description="Полностью или частично обновляет данные пользователя."
 )
-def update_user(user_id: int, data: UserUpdate) -> User:
-    idx = _find_user_index(user_id)
-    if idx == -1:
+async def update_user(user_id: int, data: UserUpdate) -> User:
+    existing = users_by_id.get(user_id)
+    if existing is None:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
 
-    existing = users[idx]
-
     # Если передали email — проверяем уникальность (кроме текущего пользователя)
     if data.email is not None:
-        for u in users:
-            if u.email == data.email and u.id != user_id:
-                raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
+        owner = users_by_email.get(data.email.lower())
+        if owner is not None and owner.id != user_id:
+            raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
 
     updated_user = User(
         id=existing.id,
@@ -292,7 +392,10 @@ def update_user(user_id: int, data: UserUpdate) -> User:
         role=data.role if data.role is not None else existing.role,
     )
 
-    users[idx] = updated_user
+    users_by_id[user_id] = updated_user
+    del users_by_email[existing.email.lower()]
+    users_by_email[updated_user.email.lower()] = updated_user
+    _invalidate_users_cache()
     return updated_user
 
 
@@ -302,13 +405,14 @@ def update_user(user_id: int, data: UserUpdate) -> User:
     summary="Удалить пользователя",
     description="Удаляет пользователя по его идентификатору."
 )
-def delete_user(user_id: int):
-    idx = _find_user_index(user_id)
-    if idx == -1:
+async def delete_user(user_id: int):
+    removed = users_by_id.pop(user_id, None)
+    if removed is None:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
-    users.pop(idx)
+    users_by_email.pop(removed.email.lower(), None)
+    _invalidate_users_cache()
     # 204 — без тела ответа
-    return
+    return _empty_204
 
 @app.post(
     "/auth/register",
@@ -317,23 +421,24 @@ def delete_user(user_id: int):
     summary="Регистрация пользователя",
     description="Регистрирует нового пользователя с валидацией данных."
 )
-def register_user(data: RegisterRequest) -> User:
+async def register_user(data: RegisterRequest) -> User:
     # Проверка уникальности email
-    for u in users:
-        if u.email == data.email:
-            raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
+    if data.email.lower() in users_by_email:
+        raise HTTPException(status_code=400, detail="Пользователь с таким email уже существует")
 
     # Создаём пользователя
     new_user = User(
-        id=_get_next_user_id(),
+        id=_next_user_id(),
         name=data.name.strip(),
         email=data.email,
         role=data.role,
     )
-    users.append(new_user)
-    hashed_password = bcrypt.hashpw(data.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    users_by_id[new_user.id] = new_user
+    users_by_email[new_user.email.lower()] = new_user
+    _invalidate_users_cache()
+    hashed = await anyio.to_thread.run_sync(_hash_password, data.password)
     # Сохраняем пароль
-    user_passwords[data.email] = hashed_password
+    user_passwords[data.email.lower()] = hashed
 
     return new_user
 
@@ -342,30 +447,36 @@ def register_user(data: RegisterRequest) -> User:
     summary="Логин пользователя",
     description="Проверяет email и пароль и возвращает приветственное сообщение."
 )
-def login_user(data: LoginRequest):
+async def login_user(data: LoginRequest):
     if not data.email or not data.password:
         raise HTTPException(status_code=400, detail="Email и пароль обязательны")
 
     # Проверяем, есть ли такой пользователь
-    user = None
-    for u in users:
-        if u.email == data.email:
-            user = u
-            break
+    user = users_by_email.get(data.email)
 
+    # Один и тот же ответ для неизвестного email и неверного пароля,
+    # чтобы по коду ответа нельзя было перебирать зарегистрированные адреса
     if user is None:
-        raise HTTPException(status_code=404, detail="Пользователь с таким email не найден")
+        raise HTTPException(status_code=401, detail="Неверный email или пароль")
 
     # Проверяем пароль
     saved_password = user_passwords.get(data.email)
 
-    if saved_password is None or not bcrypt.checkpw(data.password.encode('utf-8'), saved_password.encode('utf-8')):
-        raise HTTPException(status_code=400, detail="Неверный email или пароль")
+    password_ok = False
+    if saved_password is not None:
+        password_ok = await anyio.to_thread.run_sync(
+            bcrypt.checkpw,
+            _prehash_password(data.password),
+            saved_password,
+        )
+    if not password_ok:
+        raise HTTPException(status_code=401, detail="Неверный email или пароль")
+
+    # Отзываем старые refresh-токены пользователя через обратный индекс
+    for token_id in email_to_token_ids.pop(user.email, ()):
+        active_refresh_tokens.pop(token_id, None)
+
 
-    tokens_to_revoke = [key for key, value in active_refresh_tokens.items() if value["email"] == data.email]
-    for token_id in tokens_to_revoke:
-        del active_refresh_tokens[token_id]
-        
     token = create_access_token({"sub": user.email, "role": user.role, "name": user.name})
     refresh_token = create_refresh_token({"sub": user.email})
     return {
@@ -376,13 +487,13 @@ def login_user(data: LoginRequest):
     }
 
 @app.get("/protected")
-def protected_route(token: str = Depends(oauth2_scheme)):
+async def protected_route(token: str = Depends(oauth2_scheme)):
     # Проверяем токен
     user_data = verify_access_token(token)
     return {"message": f"Welcome, your role is {user_data['role']}"}
 
 @app.get("/me")
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     # Проверяем токен
     user_data = verify_access_token(token)
     return {
@@ -400,11 +511,11 @@ def check_user_role(token_data: dict, required_role: str):
         )
 
 @app.post("/auth/refresh")
-def refresh_access_token(body: RefreshRequest):
+async def refresh_access_token(body: RefreshRequest):
     refresh_token = body.refresh_token
     try:
         # Проверяем валидность Refresh Token
-        payload = jwt.decode(refresh_token, secret_key, algorithms=[algorithm])
+        payload = jwt.decode(refresh_token, settings.secret_key, algorithms=[settings.algorithm])
         token_id = payload.get("id")
         email = payload.get("sub")
         
@@ -415,11 +526,14 @@ def refresh_access_token(body: RefreshRequest):
             raise HTTPException(status_code=401, detail="Invalid token")
         
         # Находим пользователя по email
-        user = next((u for u in users if u.email == email), None)
+        user = users_by_email.get(email.lower())
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
 
         del active_refresh_tokens[token_id]
+        token_ids = email_to_token_ids.get(email)
+        if token_ids is not None:
+            token_ids.discard(token_id)
         # Генерируем новый Access Token
         new_access_token = create_access_token({
             "sub": user.email,
@@ -428,29 +542,28 @@ def refresh_access_token(body: RefreshRequest):
         })
         return {"access_token": new_access_token}
 
-    except ExpiredSignatureError:
+    except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Refresh token expired")
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     
 @app.get("/admin")
-def admin_route(token: str = Depends(oauth2_scheme)):
+async def admin_route(token: str = Depends(oauth2_scheme)):
     user_data = verify_access_token(token)
     check_user_role(user_data, "admin")
     return {"message": "Welcome, Admin! You have full access."}
 
 @app.get("/user-resource")
-def user_resource(token: str = Depends(oauth2_scheme)):
+async def user_resource(token: str = Depends(oauth2_scheme)):
     user_data = verify_access_token(token)
     check_user_role(user_data, "user")
     return {"message": f"Welcome, {user_data['name']}! This resource is for users only."}
 
-@app.get("/debug-token")
-def debug_token(token: str):
+async def debug_token(token: str):
     payload = jwt.decode(
         token,
-        secret_key,
-        algorithms=[algorithm],
+        settings.secret_key,
+        algorithms=[settings.algorithm],
         options={"verify_exp": False},
     )
 
@@ -459,7 +572,12 @@ def debug_token(token: str):
     return {
         "payload": payload,
         "exp_raw": exp_ts,
-        "exp_as_utc": datetime.fromtimestamp(exp_ts, tz=timezone.utc).isoformat() if exp_ts else None,
-        "server_now_utc": datetime.now(timezone.utc).isoformat(),
+        "exp_as_utc": datetime.fromtimestamp(exp_ts, tz=_UTC).isoformat() if exp_ts else None,
+        "server_now_utc": datetime.now(_UTC).isoformat(),
         "server_now_local": datetime.now().isoformat(),
-    }
\ No newline at end of file
+    }
+
+# Отладочный эндпоинт регистрируем только при DEBUG_MODE: в проде его нет
+# ни в роутере, ни в OpenAPI-схеме
+if settings.debug_mode:
+    app.get("/debug-token")(debug_token)
\ No newline at end of file
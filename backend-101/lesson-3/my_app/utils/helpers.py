@@ -1,85 +1,105 @@
-from typing import List, Iterable
+import sys
+from typing import Iterable, Tuple
 
 def pretty_print_steps(title: str, steps: Iterable[str]) -> None:
-    """Print a titled, enumerated list of steps."""
-    print(f"\n=== {title} ===")
-    for i, step in enumerate(steps, start=1):
-        print(f"{i:>2}. {step}")
+    """Print a titled, enumerated list of steps.
 
+    The whole block is emitted with one write instead of a print per
+    step, so the output costs a single stdout flush.
+    """
+    lines = "\n".join(f"{i:>2}. {step}" for i, step in enumerate(steps, start=1))
+    sys.stdout.write(f"\n=== {title} ===\n{lines}\n")
 
-def brush_teeth() -> List[str]:
+
+# The step lists are immutable data, so they are built once at import
+# time as tuples instead of being re-allocated on every call.
+
+_BRUSH_TEETH = (
+    "Turn on water and wet the brush",
+    "Put a pea of toothpaste on the brush",
+    "Brush outer surfaces in circular motions (30–45 sec)",
+    "Brush inner surfaces (30–45 sec)",
+    "Brush chewing surfaces (30 sec)",
+    "Gently brush the tongue (10–15 sec)",
+    "Spit and rinse the mouth",
+    "Rinse the brush and let it dry"
+)
+
+_DO_LAUNDRY = (
+    "Sort clothes by color and fabric",
+    "Check pockets and zippers, turn delicates inside out",
+    "Load the drum up to about 2/3 full",
+    "Add detergent and softener if needed",
+    "Choose program and temperature",
+    "Press start and wait until finished",
+    "Take out clothes and hang/lay to dry"
+)
+
+_MAKE_COFFEE = (
+    "Boil water and let it cool to ~92–96C",
+    "Grind beans medium (or prepare ground coffee)",
+    "Preheat equipment (dripper/press/cup) with hot water",
+    "Bloom coffee with a little water (30–40 sec)",
+    "Pour remaining water to target volume",
+    "Wait for extraction and serve",
+    "Optionally add milk/sugar",
+    "Enjoy"
+)
+
+_COOK_OMELET = (
+    "Crack 2–3 eggs into a bowl",
+    "Add a pinch of salt and pepper; optionally milk/cream",
+    "Whisk until smooth",
+    "Heat pan and melt some butter/oil",
+    "Pour the mixture; cook on medium heat",
+    "Lift edges with a spatula to distribute mixture",
+    "Add filling (cheese/herbs/veggies) if desired",
+    "Fold in half and serve"
+)
+
+_PREPARE_BACKPACK = (
+    "Check weather and route",
+    "Pack documents/wallet/keys/phone",
+    "Add water and a small snack",
+    "Take charger/power bank if needed",
+    "Add first-aid items if relevant",
+    "Check carry comfort and weight",
+    "Close zippers and secure pockets"
+)
+
+_START_DAY = (
+    "Wake up and do a quick stretch (1–2 min)",
+    *_BRUSH_TEETH,
+    *_MAKE_COFFEE,
+    *_PREPARE_BACKPACK,
+)
+
+
+def brush_teeth() -> Tuple[str, ...]:
     """Algorithm: brushing teeth."""
-    return [
-        "Turn on water and wet the brush",
-        "Put a pea of toothpaste on the brush",
-        "Brush outer surfaces in circular motions (30–45 sec)",
-        "Brush inner surfaces (30–45 sec)",
-        "Brush chewing surfaces (30 sec)",
-        "Gently brush the tongue (10–15 sec)",
-        "Spit and rinse the mouth",
-        "Rinse the brush and let it dry"
-    ]
-
-
-def do_laundry() -> List[str]:
+    return _BRUSH_TEETH
+
+
+def do_laundry() -> Tuple[str, ...]:
     """Algorithm: doing laundry."""
-    return [
-        "Sort clothes by color and fabric",
-        "Check pockets and zippers, turn delicates inside out",
-        "Load the drum up to about 2/3 full",
-        "Add detergent and softener if needed",
-        "Choose program and temperature",
-        "Press start and wait until finished",
-        "Take out clothes and hang/lay to dry"
-    ]
-
-
-def make_coffee() -> List[str]:
+    return _DO_LAUNDRY
+
+
+def make_coffee() -> Tuple[str, ...]:
     """Algorithm: making coffee (pour-over/French press)."""
-    return [
-        "Boil water and let it cool to ~92–96C",
-        "Grind beans medium (or prepare ground coffee)",
-        "Preheat equipment (dripper/press/cup) with hot water",
-        "Bloom coffee with a little water (30–40 sec)",
-        "Pour remaining water to target volume",
-        "Wait for extraction and serve",
-        "Optionally add milk/sugar",
-        "Enjoy"
-    ]
-
-
-def cook_omelet() -> List[str]:
+    return _MAKE_COFFEE
+
+
+def cook_omelet() -> Tuple[str, ...]:
     """Algorithm: cooking an omelet."""
-    return [
-        "Crack 2–3 eggs into a bowl",
-        "Add a pinch of salt and pepper; optionally milk/cream",
-        "Whisk until smooth",
-        "Heat pan and melt some butter/oil",
-        "Pour the mixture; cook on medium heat",
-        "Lift edges with a spatula to distribute mixture",
-        "Add filling (cheese/herbs/veggies) if desired",
-        "Fold in half and serve"
-    ]
-
-
-def prepare_backpack() -> List[str]:
+    return _COOK_OMELET
+
+
+def prepare_backpack() -> Tuple[str, ...]:
     """Algorithm: preparing a backpack before leaving."""
-    return [
-        "Check weather and route",
-        "Pack documents/wallet/keys/phone",
-        "Add water and a small snack",
-        "Take charger/power bank if needed",
-        "Add first-aid items if relevant",
-        "Check carry comfort and weight",
-        "Close zippers and secure pockets"
-    ]
-
-
-def start_day() -> List[str]:
+    return _PREPARE_BACKPACK
+
+
+def start_day() -> Tuple[str, ...]:
     """Bonus: composite algorithm that calls other functions."""
-    steps: List[str] = []
-    steps.append("Wake up and do a quick stretch (1–2 min)")
-    steps.extend(brush_teeth())
-    steps.extend(make_coffee())
-    steps.extend(prepare_backpack())
-    return steps
\ No newline at end of file
+    return _START_DAY
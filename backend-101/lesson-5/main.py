@@ -1,7 +1,9 @@
 from dotenv import load_dotenv
 import os
 
-load_dotenv()
+# Если окружение уже задано (docker/systemd), .env не читаем
+if os.environ.get("API_KEY") is None:
+    load_dotenv()
 
 api_key = os.environ.get("API_KEY")
 debug_mode_str = os.environ.get("DEBUG_MODE", "False")